@@ -123,10 +123,7 @@ def root_print_step(step, x, dx, f_of_x):
     - dx (float): The step size.
     - f_of_x (float): The function value at the current guess.
     """
-    sys.stdout.write(repr(step).rjust(5))
-    for val in [x, dx, f_of_x]:
-        sys.stdout.write("  " + repr(val).ljust(20))
-    sys.stdout.write("\n")
+    sys.stdout.write(f"{step!r:>5}  {x!r:<20}  {dx!r:<20}  {f_of_x!r:<20}\n")
 
 def root_max_steps(algorithm, max_steps):
     """Raises an exception when the maximum number of steps is exceeded.
@@ -151,20 +148,27 @@ def root_simple(f, x, dx, accuracy=1.0e-6, max_steps=1000, root_debug=False):
     - root_debug (bool): If True, print intermediate results during computation.
 
     Returns:
-    tuple: The root value and an array containing iteration details.
+    tuple: The root value and an array containing iteration details
+    (None when root_debug is False).
     """
     f0 = f(x)
     fx = f0
     step = 0
-    iterations = []
+    iterations = None
     if root_debug:
+        iterations = np.empty((max_steps + 1, 2))
         root_print_header("Simple Search with Step Halving", accuracy)
         root_print_step(step, x, dx, f0)
-        iterations.append([x,f0])
+        iterations[step] = x, f0
+    x_past = f_past = np.nan # last guess that stepped past the root
     while abs(dx) > abs(accuracy) and f0 != 0.0:
         x += dx
-        fx = f(x)
+        # After stepping back, two half steps land on the guess that already
+        # stepped past the root, reuse its value instead of calling f again
+        fx = f_past if x == x_past else f(x)
         if f0 * fx < 0.0:   # stepped past root
+            x_past = x
+            f_past = fx
             x -= dx         # step back
             dx /= 2.0       # use smaller step
         step += 1
@@ -172,8 +176,10 @@ def root_simple(f, x, dx, accuracy=1.0e-6, max_steps=1000, root_debug=False):
             root_max_steps("root_simple", max_steps)
         if root_debug:
             root_print_step(step, x, dx, fx)
-            iterations.append([x,fx])
-    return x,np.array(iterations)
+            iterations[step] = x, fx
+    if root_debug:
+        iterations = iterations[:step + 1]
+    return x, iterations
 
 def root_bisection(f, x1, x2, accuracy=1.0e-6, max_steps=1000, root_debug=False):
     """
@@ -197,7 +203,7 @@ def root_bisection(f, x1, x2, accuracy=1.0e-6, max_steps=1000, root_debug=False)
         The estimated root of the function f(x) within the specified interval.
     - iterations: numpy.ndarray, shape (n, 2)
         An array containing the iterations during the root-finding process. 
-        Each row represents [x, f(x)].
+        Each row represents [x, f(x)]. None when root_debug is False.
 
     Raises:
     - Exception:
@@ -205,25 +211,27 @@ def root_bisection(f, x1, x2, accuracy=1.0e-6, max_steps=1000, root_debug=False)
         If the maximum number of steps is reached.
 
     """
-    iterations = []
+    iterations = None
     f1 = f(x1)
     f2 = f(x2)
-    if f1 * f2 > 0.0:
+    # Compare signs instead of multiplying, the product of small values underflows to 0
+    if f1 != 0.0 and f2 != 0.0 and (f1 > 0.0) == (f2 > 0.0):
         raise ValueError("f(x1) * f(x2) > 0.0")
     x_mid = (x1 + x2) / 2.0
     f_mid = f(x_mid)
     dx = x2 - x1
     step = 0
     if root_debug:
-        iterations = []
+        iterations = np.empty((max_steps + 1, 2))
         root_print_header("Bisection Search", accuracy)
         root_print_step(step, x_mid, dx, f_mid)
-        iterations.append([x_mid,f_mid])
+        iterations[step] = x_mid, f_mid
     while abs(dx) > accuracy:
         if f_mid == 0.0:
             dx = 0.0
         else:
-            if f1 * f_mid > 0:
+            # f_mid is not zero here, compare signs instead of multiplying to avoid overflow
+            if f1 != 0.0 and (f1 > 0.0) == (f_mid > 0.0):
                 x1 = x_mid
                 f1 = f_mid
             else:
@@ -238,8 +246,10 @@ def root_bisection(f, x1, x2, accuracy=1.0e-6, max_steps=1000, root_debug=False)
             raise ValueError(warning)
         if root_debug:
             root_print_step(step, x_mid, dx, f_mid)
-            iterations.append([x_mid,f_mid])
-    return x_mid, np.array(iterations)
+            iterations[step] = x_mid, f_mid
+    if root_debug:
+        iterations = iterations[:step + 1]
+    return x_mid, iterations
 
 
 def root_secant(f, x0, x1, accuracy=1.0e-6, max_steps=20, root_debug=False):
@@ -255,14 +265,16 @@ def root_secant(f, x0, x1, accuracy=1.0e-6, max_steps=20, root_debug=False):
     - root_debug (bool): If True, print intermediate results during computation.
 
     Returns:
-    tuple: The root value and an array containing iteration details.
+    tuple: The root value and an array containing iteration details
+    (None when root_debug is False).
     """
-    iterations = []
+    iterations = None
     f0 = f(x0)
     dx = x1 - x0
     step = 0
     if root_debug:
-        iterations.append([x0, f0])
+        iterations = np.empty((max_steps + 1, 2))
+        iterations[step] = x0, f0
     if f0 == 0:
         return x0
     while abs(dx) > abs(accuracy):
@@ -271,7 +283,8 @@ def root_secant(f, x0, x1, accuracy=1.0e-6, max_steps=20, root_debug=False):
             return x1
         if f1 == f0:
             raise ValueError("Secant horizontal f(x0) = f(x1) algorithm fails")
-        dx *= -f1 / (f1 - f0)
+        # Two-point update x1 - f1 * (x1 - x0) / (f1 - f0), reusing f0 from the last step
+        dx = - f1 * (x1 - x0) / (f1 - f0)
         x0 = x1
         f0 = f1
         x1 += dx
@@ -279,8 +292,10 @@ def root_secant(f, x0, x1, accuracy=1.0e-6, max_steps=20, root_debug=False):
         if step > max_steps:
             root_max_steps("root_secant", max_steps)
         if root_debug:
-            iterations.append([x1, f1])
-    return x1, np.array(iterations)
+            iterations[step] = x1, f1
+    if root_debug:
+        iterations = iterations[:step + 1]
+    return x1, iterations
 
 def root_tangent(f, fp, x0, accuracy=1.0e-6, max_steps=20, root_debug=False):
     """Return root of f(x) with derivative fp = df(x)/dx
@@ -296,9 +311,10 @@ def root_tangent(f, fp, x0, accuracy=1.0e-6, max_steps=20, root_debug=False):
     - root_debug (bool): If True, print intermediate results during computation.
 
     Returns:
-    tuple: The root value and an array containing iteration details.
+    tuple: The root value and an array containing iteration details
+    (None when root_debug is False).
     """
-    iterations = []
+    iterations = None
     f0 = f(x0)
     fp0 = fp(x0)
     if fp0 == 0.0:
@@ -306,14 +322,11 @@ def root_tangent(f, fp, x0, accuracy=1.0e-6, max_steps=20, root_debug=False):
     dx = -f0 / fp0
     step = 0
     if root_debug:
-        iterations.append([x0, f0])
+        iterations = np.empty((max_steps + 1, 2))
+        iterations[step] = x0, f0
     if f0 == 0.0:
         return x0
     while True:
-        fp0 = fp(x0)
-        if fp0 == 0.0:
-            raise ValueError(" root_tangent df/dx = 0 algorithm fails")
-        dx = -f0 / fp0
         x0 += dx
         f0 = f(x0)
         if abs(dx) <= accuracy or f0 == 0.0:
@@ -322,5 +335,10 @@ def root_tangent(f, fp, x0, accuracy=1.0e-6, max_steps=20, root_debug=False):
         if step > max_steps:
             root_max_steps("root_tangent", max_steps)
         if root_debug:
-            iterations.append([x0, f0])
+            iterations[step] = x0, f0
+        # f0 is already up to date, only the derivative at the new guess is needed
+        fp0 = fp(x0)
+        if fp0 == 0.0:
+            raise ValueError(" root_tangent df/dx = 0 algorithm fails")
+        dx = -f0 / fp0
     return x0
@@ -26,10 +26,10 @@ x0 = np.pi/100
 tol = 1e-5
 
 algorithms = ['Simple Search', 'Bisection Search', 'Tangent Search', \
-              'Secant Search']
+              'Secant Search', 'Brent Search']
 
 # Define a list of functions to call
-functions = [root_simple, root_bisection, root_tangent, root_secant]
+functions = [root_simple, root_bisection, root_tangent, root_secant, root_brent]
 
 # Define a list of functions and their names
 funcs = [(lambda x: np.tan(x), lambda x: 1/(np.cos(x))**2, 'tan(x)'), \
@@ -41,7 +41,8 @@ for f, fp, name in funcs:
     plot_function(f, x1, x2, name)
     # Define a list of arguments to pass
     arguments = [(f, xmid, dx, tol, 1000, True), (f, x1, x2, tol, 1000, True), \
-     (f, fp, x0, tol, 20, True), (f, x1, x2, tol, 20, True)]
+     (f, fp, x0, tol, 20, True), (f, x1, x2, tol, 20, True), \
+     (f, x1, x2, tol, 1000, True)]
     # Find the roots
     n, root = find_roots(f, x1, x2, tol)
     np.set_printoptions (formatter= {'float': ' {: .2f}'.format})
@@ -49,7 +50,7 @@ for f, fp, name in funcs:
     # Print the roots
     print_roots(n, root_deg, root, name)
     # Print the results
-    answers_in_deg, answers_in_rad, steps = print_results(algorithms, \
-                                                          functions, arguments)
+    answers_in_deg, answers_in_rad, steps, iterations = print_results(algorithms, \
+                                                          functions, arguments, True)
     # Print the efficiency
-    efficiency(answers_in_rad, root, algorithms, steps, tol)
+    efficiency(answers_in_rad, root, algorithms, steps, tol, iterations)
@@ -6,6 +6,19 @@ import numpy as np
 import matplotlib.pyplot as plt
 import scipy.optimize as opt
 
+try:
+    import numba
+    from numba.extending import is_jitted
+except ImportError: # numba is optional, root_bisection_vec uses NumPy alone without it
+    numba = None
+
+# x tick values and labels in multiples of pi/2 used by plot_function
+_XTICKS = np.arange(-5*np.pi, 5*np.pi + np.pi/2, np.pi/2)
+_XTICKLABELS = [r'$-5\pi$', r'$-9\pi/2$', r'$-4\pi$', r'$-7\pi/2$', r'$-3\pi$', r'$-5\pi/2$', \
+                r'$-2\pi$', r'$-3\pi/2$', r'$-\pi$', r'$-\pi/2$', r'$0$', r'$\pi/2$', r'$\pi$', \
+                r'$3\pi/2$', r'$2\pi$', r'$5\pi/2$', r'$3\pi$', r'$7\pi/2$', r'$4\pi$', \
+                r'$9\pi/2$', r'$5\pi$']
+
 def root_print_header(algorithm, accuracy):
     """Prints the header for the root finding process.
 
@@ -37,10 +50,7 @@ def root_print_step(step, x, dx, f_of_x):
     f_of_x : float
         The value of the function at the current guess.
     """
-    sys.stdout.write(repr(step).rjust(5))
-    for val in [x, dx, f_of_x]:
-        sys.stdout.write("  " + repr(val).ljust(20))
-    sys.stdout.write("\n")
+    sys.stdout.write(f"{step!r:>5}  {x!r:<20}  {dx!r:<20}  {f_of_x!r:<20}\n")
 
 def root_max_steps(algorithm, max_steps):
     """Raises an exception when the maximum number of steps is exceeded.
@@ -60,6 +70,32 @@ def root_max_steps(algorithm, max_steps):
     raise Exception(" " + algorithm + ": maximum number of steps " +
                     repr(max_steps) + " exceeded\n")
 
+def _root_recorder(algorithm, accuracy, max_steps):
+    """Prints the header and returns a callback that prints and stores each step.
+
+    Parameters
+    ----------
+    algorithm : str
+        The name of the root finding algorithm used.
+    accuracy : float
+        The requested accuracy for the root finding process.
+    max_steps : int
+        The maximum number of steps allowed.
+
+    Returns
+    -------
+    record : function
+        Called as record(step, x, dx, f_of_x) for every step.
+    iterations : numpy.array
+        The preallocated history, record writes row step as [x, f_of_x].
+    """
+    root_print_header(algorithm, accuracy)
+    iterations = np.empty((max_steps + 1, 2))
+    def record(step, x, dx, f_of_x):
+        root_print_step(step, x, dx, f_of_x)
+        iterations[step] = x, f_of_x
+    return record, iterations
+
 def root_simple(f, x, dx, accuracy=1.0e-6, max_steps=1000, root_debug=False):
     """Returns the root of f(x) given a guess x and a step dx with specified accuracy.
 
@@ -82,8 +118,9 @@ def root_simple(f, x, dx, accuracy=1.0e-6, max_steps=1000, root_debug=False):
     -------
     x : float
         The final guess for the root.
-    iterations : numpy.array
+    iterations : numpy.array or None
         An array of the guesses and function values for each step.
+        None when root_debug is False.
     step : int
         The number of steps taken.
 
@@ -95,24 +132,83 @@ def root_simple(f, x, dx, accuracy=1.0e-6, max_steps=1000, root_debug=False):
     f0 = f(x)
     fx = f0
     step = 0
-    iterations = []
-    if root_debug:        
-        root_print_header("Simple Search with Step Halving", accuracy)
-        root_print_step(step, x, dx, f0)
-        iterations.append([x,f0])
+    record = iterations = None
+    if root_debug:
+        record, iterations = _root_recorder("Simple Search with Step Halving", accuracy, max_steps)
+        record(step, x, dx, f0)
+    x_past = f_past = np.nan # last guess that stepped past the root
     while abs(dx) > abs(accuracy) and f0 != 0.0:
         x += dx
-        fx = f(x)
+        # After stepping back, two half steps land on the guess that already
+        # stepped past the root, reuse its value instead of calling f again
+        fx = f_past if x == x_past else f(x)
         if f0 * fx < 0.0:   # stepped past root
+            x_past = x
+            f_past = fx
             x -= dx         # step back
             dx /= 2.0       # use smaller step
         step += 1
         if step > max_steps:
             root_max_steps("root_simple", max_steps)
         if root_debug:
-            root_print_step(step, x, dx, fx)
-            iterations.append([x,fx])
-    return x,np.array(iterations), step
+            record(step, x, dx, fx)
+    if root_debug:
+        iterations = iterations[:step + 1]
+    return x, iterations, step
+
+def _bisection_kernel(f, x1, x2, f1, accuracy, max_steps, record=None):
+    """Runs the bisection loop shared by root_bisection and the compiled batch.
+
+    Parameters
+    ----------
+    f : function
+        The function to find the root of.
+    x1 : float
+        The lower bound of the interval.
+    x2 : float
+        The upper bound of the interval.
+    f1 : float
+        The value of f(x1).
+    accuracy : float
+        The requested accuracy for the root finding process.
+    max_steps : int
+        The maximum number of steps allowed.
+    record : function or None, optional
+        Called as record(step, x, dx, f_of_x) for every step, see _root_recorder.
+        Default is None, which is also what the compiled batch uses.
+
+    Returns
+    -------
+    x_mid : float
+        The final guess for the root.
+    step : int
+        The number of steps taken. Larger than max_steps when the loop was stopped.
+    """
+    x_mid = (x1 + x2) / 2.0
+    f_mid = f(x_mid)
+    dx = x2 - x1
+    step = 0
+    if record is not None:
+        record(step, x_mid, dx, f_mid)
+    while abs(dx) > accuracy:
+        if f_mid == 0.0:
+            dx = 0.0
+        else:
+            # f_mid is not zero here, compare signs instead of multiplying to avoid overflow
+            if f1 != 0.0 and (f1 > 0.0) == (f_mid > 0.0):
+                x1 = x_mid
+                f1 = f_mid
+            else:
+                x2 = x_mid
+            x_mid = (x1 + x2) / 2.0
+            f_mid = f(x_mid)
+            dx = x2 - x1
+        step += 1
+        if step > max_steps:
+            break
+        if record is not None:
+            record(step, x_mid, dx, f_mid)
+    return x_mid, step
 
 def root_bisection(f, x1, x2, accuracy=1.0e-6, max_steps=1000, root_debug=False):
     """Returns the root of f(x) in the interval bracketed by x1 and x2 with specified accuracy.
@@ -136,8 +232,9 @@ def root_bisection(f, x1, x2, accuracy=1.0e-6, max_steps=1000, root_debug=False)
     -------
     x_mid : float
         The final guess for the root.
-    iterations : numpy.array
+    iterations : numpy.array or None
         An array of the guesses and function values for each step.
+        None when root_debug is False.
     step : int
         The number of steps taken.
 
@@ -146,41 +243,21 @@ def root_bisection(f, x1, x2, accuracy=1.0e-6, max_steps=1000, root_debug=False)
     Exception
         When f(x1) * f(x2) > 0.0 or when the maximum number of steps is exceeded.
     """
-    iterations = []
     f1 = f(x1)
     f2 = f(x2)
-    if f1 * f2 > 0.0:
+    # Compare signs instead of multiplying, the product of small values underflows to 0
+    if f1 != 0.0 and f2 != 0.0 and (f1 > 0.0) == (f2 > 0.0):
         raise Exception("f(x1) * f(x2) > 0.0")
-    x_mid = (x1 + x2) / 2.0
-    f_mid = f(x_mid)
-    dx = x2 - x1
-    step = 0
+    record = iterations = None
     if root_debug:
-        iterations = []
-        root_print_header("Bisection Search", accuracy)
-        root_print_step(step, x_mid, dx, f_mid)
-        iterations.append([x_mid,f_mid])
-    while abs(dx) > accuracy:
-        if f_mid == 0.0:
-            dx = 0.0
-        else:
-            if f1 * f_mid > 0:
-                x1 = x_mid
-                f1 = f_mid
-            else:
-                x2 = x_mid
-                f2 = f_mid
-            x_mid = (x1 + x2) / 2.0
-            f_mid = f(x_mid)
-            dx = x2 - x1
-        step += 1
-        if step > max_steps:
-            warning = "Too many steps (" + repr(step) + ") in root_bisection"
-            raise Exception(warning)
-        if root_debug:
-            root_print_step(step, x_mid, dx, f_mid)
-            iterations.append([x_mid,f_mid])
-    return x_mid,np.array(iterations), step
+        record, iterations = _root_recorder("Bisection Search", accuracy, max_steps)
+    x_mid, step = _bisection_kernel(f, x1, x2, f1, accuracy, max_steps, record)
+    if step > max_steps:
+        warning = "Too many steps (" + repr(step) + ") in root_bisection"
+        raise Exception(warning)
+    if root_debug:
+        iterations = iterations[:step + 1]
+    return x_mid, iterations, step
 
 def root_secant(f, x0, x1, accuracy=1.0e-6, max_steps=20,root_debug=False):
     """Returns the root of f(x) given two guesses x0 and x1 with specified accuracy.
@@ -204,8 +281,9 @@ def root_secant(f, x0, x1, accuracy=1.0e-6, max_steps=20,root_debug=False):
     -------
     x1 : float
         The final guess for the root.
-    iterations : numpy.array
+    iterations : numpy.array or None
         An array of the guesses and function values for each step.
+        None when root_debug is False.
     num_steps : int
         The number of steps taken.
 
@@ -214,37 +292,37 @@ def root_secant(f, x0, x1, accuracy=1.0e-6, max_steps=20,root_debug=False):
     Exception
         When f(x0) = f(x1) or when the maximum number of steps is exceeded.
     """
-    iterations=[]
+    record = iterations = None
+    if root_debug:
+        record, iterations = _root_recorder("Secant Search", accuracy, max_steps)
     f0 = f(x0)
     dx = x1 - x0
-    step = 0
     num_steps = 0 # Add a variable to store the number of steps
-    if root_debug:        
-        root_print_header("Secant Search", accuracy)
-        root_print_step(step, x0, dx, f0)
-        iterations.append([x0,f0])
+    if root_debug:
+        record(num_steps, x0, dx, f0)
     if f0 == 0:
-        return x0, np.array(iterations), num_steps # Return x0 as the root and the number of steps
-    while abs(dx) > abs(accuracy):
+        x1 = x0 # x0 is the root, f(x1) is never needed
+    while f0 != 0 and abs(dx) > abs(accuracy):
         f1 = f(x1)
         if f1 == 0:
-            return x1, np.array(iterations), num_steps # Return x1 as the root and the number of steps
+            break
         if f1 == f0:
             raise Exception("Secant horizontal f(x0) = f(x1) algorithm fails")
-        dx *= - f1 / (f1 - f0)
+        # Two-point update x1 - f1 * (x1 - x0) / (f1 - f0), reusing f0 from the last step
+        dx = - f1 * (x1 - x0) / (f1 - f0)
         x0 = x1
         f0 = f1
         x1 += dx
-        step += 1
         num_steps += 1 # Increment the number of steps by one
-        if step > max_steps:
+        if num_steps > max_steps:
             root_max_steps("root_secant", max_steps)
         if root_debug:
-            root_print_step(step, x1, dx, f1)
-            iterations.append([x1,f1])
-    return x1, np.array(iterations), num_steps # Return the final outputs
+            record(num_steps, x1, dx, f1)
+    if root_debug:
+        iterations = iterations[:num_steps + 1]
+    return x1, iterations, num_steps # Return the root, the iterations, and the number of steps
 
-def root_tangent(f, fp, x0, accuracy=1.0e-6, max_steps=20, root_debug=False):
+def root_tangent(f, fp, x0, accuracy=1.0e-6, max_steps=20, root_debug=False, damped=False):
     """Returns the root of f(x) with derivative fp = df(x)/dx
     given an initial guess x0, with specified accuracy.
     Uses Newton-Raphson (tangent) root-finding algorithm.
@@ -252,9 +330,10 @@ def root_tangent(f, fp, x0, accuracy=1.0e-6, max_steps=20, root_debug=False):
     Parameters
     ----------
     f : function
-        The function to find the root of.
-    fp : function
-        The derivative of the function f.
+        The function to find the root of. When fp is None, f must return the tuple
+        (f(x), df(x)/dx) so that shared subexpressions are only computed once.
+    fp : function or None
+        The derivative of the function f, or None when f also returns the derivative.
     x0 : float
         The initial guess for the root.
     accuracy : float, optional
@@ -263,13 +342,17 @@ def root_tangent(f, fp, x0, accuracy=1.0e-6, max_steps=20, root_debug=False):
         The maximum number of steps allowed. Default is 20.
     root_debug : bool, optional
         Whether to print the information for each step. Default is False.
+    damped : bool, optional
+        Whether to halve a step that is larger than the previous one, which keeps
+        the iteration from running away far from the root. Default is False.
 
     Returns
     -------
     x0 : float
         The final guess for the root.
-    iterations : numpy.array
+    iterations : numpy.array or None
         An array of the guesses and function values for each step.
+        None when root_debug is False.
     num_steps : int
         The number of steps taken.
 
@@ -278,38 +361,318 @@ def root_tangent(f, fp, x0, accuracy=1.0e-6, max_steps=20, root_debug=False):
     Exception
         When fp(x0) = 0 or when the maximum number of steps is exceeded.
     """
-    iterations = []
-    f0 = f(x0)
-    fp0 = fp(x0)
+    if fp is None:
+        f0, fp0 = f(x0)
+    else:
+        f0 = f(x0)
+        fp0 = fp(x0)
     if fp0 == 0.0:
         raise Exception(" root_tangent df/dx = 0 algorithm fails")
     dx = - f0 / fp0
-    step = 0
     num_steps = 0 # Add a variable to store the number of steps
+    record = iterations = None
     if root_debug:
-        root_print_header("Tangent Search", accuracy)
-        root_print_step(step, x0, dx, f0)
-        iterations.append([x0,f0])
+        record, iterations = _root_recorder("Tangent Search", accuracy, max_steps)
+        record(num_steps, x0, dx, f0)
     # Check if f(x0) is zero
-    if f0 == 0.0:
-        return x0, np.array(iterations), num_steps # Return x0 as the root and the number of steps
-    while True:
-        fp0 = fp(x0)
-        if fp0 == 0.0:
-            raise Exception(" root_tangent df/dx = 0 algorithm fails")
-        dx = - f0 / fp0
+    while f0 != 0.0:
         x0 += dx
-        f0 = f(x0)
+        if fp is None:
+            f0, fp0 = f(x0)
+        else:
+            f0 = f(x0)
         if abs(dx) <= accuracy or f0 == 0.0:
-            return x0, np.array(iterations), num_steps # Return the root, the iterations, and the number of steps
-        step += 1
+            break
         num_steps += 1 # Increment the number of steps by one
-        if step > max_steps:
+        if num_steps > max_steps:
             root_max_steps("root_tangent", max_steps)
         if root_debug:
-            root_print_step(step, x0, dx, f0)
-            iterations.append([x0,f0])
-    return x0, np.array(iterations), num_steps # Return the final outputs
+            record(num_steps, x0, dx, f0)
+        # f0 is already up to date, only the derivative at the new guess is needed
+        if fp is not None:
+            fp0 = fp(x0)
+        if fp0 == 0.0:
+            raise Exception(" root_tangent df/dx = 0 algorithm fails")
+        dx_new = - f0 / fp0
+        if damped and abs(dx_new) > abs(dx):
+            dx_new *= 0.5
+        dx = dx_new
+    if root_debug:
+        iterations = iterations[:num_steps + 1]
+    return x0, iterations, num_steps # Return the root, the iterations, and the number of steps
+
+def _bisection_batch(f, x1, x2, accuracy, max_steps):
+    """Runs the compiled bisection kernel on every lane of flat arrays in parallel.
+
+    Parameters
+    ----------
+    f : function
+        The numba.njit function to find the roots of.
+    x1 : numpy.array
+        The lower bounds of the intervals.
+    x2 : numpy.array
+        The upper bounds of the intervals.
+    accuracy : float
+        The requested accuracy for the root finding process.
+    max_steps : int
+        The maximum number of steps allowed.
+
+    Returns
+    -------
+    x_mid : numpy.array
+        The final guesses for the roots.
+    steps : numpy.array
+        The number of steps taken in each lane, -1 where f(x1) * f(x2) > 0.0.
+    """
+    x_mid = np.empty(x1.size)
+    steps = np.empty(x1.size, dtype=np.int64)
+    for i in numba.prange(x1.size):
+        f1 = f(x1[i])
+        f2 = f(x2[i])
+        if f1 != 0.0 and f2 != 0.0 and (f1 > 0.0) == (f2 > 0.0):
+            x_mid[i] = np.nan
+            steps[i] = -1
+        else:
+            x_mid[i], steps[i] = _bisection_kernel_jit(f, x1[i], x2[i], f1, accuracy, max_steps)
+    return x_mid, steps
+
+if numba is not None:
+    # nogil lets the compiled kernels run concurrently from several Python threads
+    _bisection_kernel_jit = numba.njit(cache=True, nogil=True)(_bisection_kernel)
+    _bisection_batch_jit = numba.njit(cache=True, nogil=True, parallel=True)(_bisection_batch)
+
+def _use_jit(f):
+    """Checks whether the compiled kernels can be used for the function f.
+
+    Parameters
+    ----------
+    f : function
+        The function to find the root of.
+
+    Returns
+    -------
+    bool
+        True when numba is installed and f is a numba.njit function.
+    """
+    return numba is not None and is_jitted(f)
+
+def root_brent(f, x1, x2, accuracy=1.0e-6, max_steps=1000, root_debug=False):
+    """Returns the root of f(x) in the interval bracketed by x1 and x2 with specified accuracy.
+    Uses Brent's method, which combines inverse quadratic interpolation, the secant
+    step and bisection. It keeps the root bracketed like bisection while converging
+    superlinearly near the root.
+
+    Parameters
+    ----------
+    f : function
+        The function to find the root of.
+    x1 : float
+        The lower bound of the interval. Must have opposite sign of f(x2).
+    x2 : float
+        The upper bound of the interval. Must have opposite sign of f(x1).
+    accuracy : float, optional
+        The requested accuracy for the root finding process. Default is 1.0e-6.
+    max_steps : int, optional
+        The maximum number of steps allowed. Default is 1000.
+    root_debug : bool, optional
+        Whether to print the information for each step. Default is False.
+
+    Returns
+    -------
+    b : float
+        The final guess for the root.
+    iterations : numpy.array or None
+        An array of the guesses and function values for each step.
+        None when root_debug is False.
+    step : int
+        The number of steps taken.
+
+    Raises
+    ------
+    Exception
+        When f(x1) * f(x2) > 0.0 or when the maximum number of steps is exceeded.
+    """
+    record = iterations = None
+    a, b = x1, x2
+    fa = f(a)
+    fb = f(b)
+    # Compare signs instead of multiplying, the product of small values underflows to 0
+    if fa != 0.0 and fb != 0.0 and (fa > 0.0) == (fb > 0.0):
+        raise Exception("f(x1) * f(x2) > 0.0")
+    c, fc = a, fa # c is the contrapoint, f(b) and f(c) have opposite signs
+    d = e = b - a # d is the current step, e the one before
+    step = 0
+    if root_debug:
+        record, iterations = _root_recorder("Brent Search", accuracy, max_steps)
+        record(step, b, d, fb)
+    while True:
+        if fb != 0.0 and fc != 0.0 and (fb > 0.0) == (fc > 0.0): # the root is between a and b
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb): # make b the best guess
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2.0 * np.finfo(float).eps * abs(b) + 0.5 * accuracy
+        x_mid = 0.5 * (c - b)
+        if abs(x_mid) <= tol or fb == 0.0:
+            break
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c: # secant step
+                p = 2.0 * x_mid * s
+                q = 1.0 - s
+            else: # inverse quadratic interpolation
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * x_mid * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0.0:
+                q = -q
+            p = abs(p)
+            if 2.0 * p < min(3.0 * x_mid * q - abs(tol * q), abs(e * q)):
+                e = d # accept the interpolation
+                d = p / q
+            else:
+                d = e = x_mid # fall back to bisection
+        else:
+            d = e = x_mid # fall back to bisection
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, x_mid)
+        fb = f(b)
+        step += 1
+        if step > max_steps:
+            root_max_steps("root_brent", max_steps)
+        if root_debug:
+            record(step, b, d, fb)
+    if root_debug:
+        iterations = iterations[:step + 1]
+    return b, iterations, step
+
+def root_bisection_vec(f, x1, x2, accuracy=1.0e-6, max_steps=1000):
+    """Returns the roots of f(x) for arrays of intervals bracketed by x1 and x2.
+
+    Every lane of the arrays is an independent bisection search. The function f is
+    called once per step on all midpoints together, and only the lanes that have not
+    converged yet are updated.
+
+    Parameters
+    ----------
+    f : function
+        The function to find the roots of. Must accept and return numpy arrays.
+        If f is a numba.njit function, the lanes are instead solved by the compiled
+        bisection kernel in parallel threads, and f only needs to accept floats.
+    x1 : array_like
+        The lower bounds of the intervals. Must have opposite sign of f(x2).
+    x2 : array_like
+        The upper bounds of the intervals. Must have opposite sign of f(x1).
+    accuracy : float, optional
+        The requested accuracy for the root finding process. Default is 1.0e-6.
+    max_steps : int, optional
+        The maximum number of steps allowed. Default is 1000.
+
+    Returns
+    -------
+    x_mid : numpy.array
+        The final guesses for the roots.
+    steps : numpy.array
+        The number of steps taken in each lane.
+
+    Raises
+    ------
+    Exception
+        When f(x1) * f(x2) > 0.0 in any lane or when the maximum number of steps is exceeded.
+    """
+    x1, x2 = np.broadcast_arrays(np.asarray(x1, dtype=float), np.asarray(x2, dtype=float))
+    if _use_jit(f):
+        x_mid, steps = _bisection_batch_jit(f, x1.ravel(), x2.ravel(), accuracy, max_steps)
+        if np.any(steps < 0):
+            raise Exception("f(x1) * f(x2) > 0.0")
+        if np.any(steps > max_steps):
+            warning = "Too many steps (" + repr(int(steps.max())) + ") in root_bisection_vec"
+            raise Exception(warning)
+        return x_mid.reshape(x1.shape), steps.reshape(x1.shape)
+    f1 = f(x1)
+    f2 = f(x2)
+    if np.any((f1 != 0.0) & (f2 != 0.0) & ((f1 > 0.0) == (f2 > 0.0))):
+        raise Exception("f(x1) * f(x2) > 0.0")
+    x_mid = (x1 + x2) / 2.0
+    f_mid = f(x_mid)
+    dx = x2 - x1
+    steps = np.zeros(x_mid.shape, dtype=int)
+    active = np.abs(dx) > accuracy
+    while np.any(active):
+        found = active & (f_mid == 0.0)
+        dx = np.where(found, 0.0, dx)
+        update = active & ~found
+        same_sign = (f1 != 0.0) & ((f1 > 0.0) == (f_mid > 0.0))
+        x1 = np.where(update & same_sign, x_mid, x1)
+        f1 = np.where(update & same_sign, f_mid, f1)
+        x2 = np.where(update & ~same_sign, x_mid, x2)
+        x_mid = np.where(update, (x1 + x2) / 2.0, x_mid)
+        f_mid = np.where(update, f(x_mid), f_mid)
+        dx = np.where(update, x2 - x1, dx)
+        steps += active
+        if np.any(steps > max_steps):
+            warning = "Too many steps (" + repr(int(steps.max())) + ") in root_bisection_vec"
+            raise Exception(warning)
+        active = np.abs(dx) > accuracy
+    return x_mid, steps
+
+def root_tangent_vec(f, fp, x0, accuracy=1.0e-6, max_steps=20):
+    """Returns the roots of f(x) with derivative fp = df(x)/dx for an array of
+    initial guesses x0, with specified accuracy.
+    Uses Newton-Raphson (tangent) root-finding algorithm.
+
+    Every lane of the array is an independent Newton-Raphson search. The functions
+    f and fp are called once per step on all guesses together, and only the lanes
+    that have not converged yet are updated.
+
+    Parameters
+    ----------
+    f : function
+        The function to find the roots of. Must accept and return numpy arrays.
+    fp : function
+        The derivative of the function f. Must accept and return numpy arrays.
+    x0 : array_like
+        The initial guesses for the roots.
+    accuracy : float, optional
+        The requested accuracy for the root finding process. Default is 1.0e-6.
+    max_steps : int, optional
+        The maximum number of steps allowed. Default is 20.
+
+    Returns
+    -------
+    x0 : numpy.array
+        The final guesses for the roots.
+    steps : numpy.array
+        The number of steps taken in each lane.
+
+    Raises
+    ------
+    Exception
+        When fp(x0) = 0 in any lane or when the maximum number of steps is exceeded.
+    """
+    x0 = np.array(x0, dtype=float)
+    f0 = f(x0)
+    fp0 = fp(x0)
+    # Like root_tangent, the first derivative is checked in every lane, also where f(x0) = 0
+    if np.any(fp0 == 0.0):
+        raise Exception(" root_tangent_vec df/dx = 0 algorithm fails")
+    steps = np.zeros(x0.shape, dtype=int)
+    active = f0 != 0.0
+    while np.any(active):
+        dx = np.divide(-f0, fp0, out=np.zeros_like(x0), where=active)
+        x0 = x0 + dx
+        f0 = np.where(active, f(x0), f0)
+        active = active & (np.abs(dx) > accuracy) & (f0 != 0.0)
+        steps += active
+        if np.any(steps > max_steps):
+            root_max_steps("root_tangent_vec", max_steps)
+        if np.any(active):
+            fp0 = fp(x0)
+            if np.any(active & (fp0 == 0.0)):
+                raise Exception(" root_tangent_vec df/dx = 0 algorithm fails")
+    return x0, steps
 
 # Define a function to plot a function
 def plot_function(f, x1, x2, name):
@@ -330,27 +693,17 @@ def plot_function(f, x1, x2, name):
 
     # Compute the corresponding y values
     yvals = f(xvals)
-    y3vals = np.zeros(len(xvals)) # Create an array of zeros
 
     # Plot the function
     plt.plot(xvals, yvals)
-    plt.plot(xvals, y3vals, color='red') # Plot the line y=0 in red
+    plt.axhline(0, color='red') # Plot the line y=0 in red
 
     # Set the labels for x and y axes
     plt.xlabel("x")
     plt.ylabel(f'{name}') # Change the y label to match the function
 
-    # Create an array of x tick values
-    xticks = np.arange(-5*np.pi, 5*np.pi + np.pi/2, np.pi/2)
-
-    # Create an array of x tick labels
-    xticklabels = [r'$-5\pi$', r'$-9\pi/2$', r'$-4\pi$', r'$-7\pi/2$', r'$-3\pi$', r'$-5\pi/2$', \
-                   r'$-2\pi$', r'$-3\pi/2$', r'$-\pi$', r'$-\pi/2$', r'$0$', r'$\pi/2$', r'$\pi$', \
-                   r'$3\pi/2$', r'$2\pi$', r'$5\pi/2$', r'$3\pi$', r'$7\pi/2$', r'$4\pi$', \
-                   r'$9\pi/2$', r'$5\pi$']
-
     # Set the ticks for x axis in terms of pi
-    plt.xticks(xticks, xticklabels)
+    plt.xticks(_XTICKS, _XTICKLABELS)
 
     # Set the limits for x and y axis
     plt.xlim(x1, x2)
@@ -390,21 +743,22 @@ def find_roots(f, a, b, tol):
     else:
         roots = [] # Initialize the list of roots as empty
 
-    # Check for the sign changes in the interior points
-    for i in range(len(y)-1):
-        if y[i] * y[i+1] < 0: # If there is a sign change between two consecutive points
-            n += 1 # Increment the number of roots
-            root = opt.brentq(f, x[i], x[i+1], xtol=tol, rtol=tol) # Find the root in the subinterval
-            # Check if the function is tan(x)
-            if np.isclose(f(root), math.tan(root), atol=tol):
-                # Check if the root is close to an odd number times pi/2
-                # if not np.isclose(root % np.pi, np.pi/2, atol=tol):
-                if not np.isclose(np.round(2*root/np.pi) % 2, 1, atol=tol): # If the root is not an odd multiple of pi/2
-                    roots.append(root) # Append the root to the list
-                else:
-                    n -= 1 # Decrement the number of roots
-            else:
-                roots.append(root) # Append the root to the list
+    # Find all the sign changes between consecutive points in one vectorized pass,
+    # multiplying the signs instead of the values avoids overflow and underflow,
+    # zeros and NaN (where f is not defined) never count as a sign change
+    signs = np.sign(y)
+    sign_changes = np.flatnonzero(signs[:-1] * signs[1:] < 0)
+
+    # Only the bracketing subintervals need a call to brentq
+    for i in sign_changes:
+        root = opt.brentq(f, x[i], x[i+1], xtol=tol, rtol=tol) # Find the root in the subinterval
+        # Check if the function is tan(x) and the root is close to an odd multiple of pi/2,
+        # in that case the sign change comes from a pole and not from a root
+        if np.isclose(f(root), math.tan(root), atol=tol) and \
+           np.isclose(np.round(2*root/np.pi) % 2, 1, atol=tol):
+            continue
+        n += 1 # Increment the number of roots
+        roots.append(root) # Append the root to the list
 
     # Check for the root at the upper bound
     if np.isclose(f(b), 0, atol=tol): # If the function is zero at b
@@ -431,7 +785,7 @@ def print_roots(n, root_deg, root, name):
   print(f'There are {n} actual roots (in degrees), \nthey are: {(root_deg)} \n')
   print(f'There are {n} actual roots (in radians), \nthey are: {(root)} \n')
 
-def print_results(algorithms, functions, arguments):
+def print_results(algorithms, functions, arguments, return_iterations=False):
   """Print the results of applying different algorithms to different functions.
 
   This function loops over the algorithms, functions, and arguments, and prints the \
@@ -442,17 +796,20 @@ def print_results(algorithms, functions, arguments):
     algorithms (list): The list of algorithm names.
     functions (list): The list of function objects.
     arguments (list): The list of arguments for each function.
+    return_iterations (bool, optional): Whether to also return the iteration histories.
 
   Returns:
     list: The list of answers in degrees.
     list: The list of answers in radians.
     list: The list of steps for each function.
+    list: The list of iteration histories, only when return_iterations is True.
 
   """
   # Initialize the lists
   answers_in_deg = []
   answers_in_rad = []
   steps = []
+  histories = []
 
   # Loop over the algorithms, functions, and arguments
   for i, (alg, func, args) in enumerate(zip(algorithms, functions, arguments)):
@@ -471,16 +828,53 @@ def print_results(algorithms, functions, arguments):
     print(f'root in rad: {answer:.20f} \nsteps required: {step} \n')
     answers_in_deg.append(answer_to_deg)
     steps.append(step)
+    histories.append(iterations)
   # Return the lists
+  if return_iterations:
+    return answers_in_deg, answers_in_rad, steps, histories
   return answers_in_deg, answers_in_rad, steps
 
+def convergence_order(iterations, root):
+  """Estimate the order of convergence of a root finding run from its iteration history.
+
+  With the errors e_k = |x_k - root| of successive guesses, the order sigma follows from
+  |e_{k+1}| = mu * |e_k|^sigma as log(e_{k+1}/e_k) / log(e_k/e_{k-1}). The estimate is
+  the median over the history, about 2 for the tangent search and 1.6 for the secant
+  search. The bisection errors do not shrink monotonically, so there it is only rough.
+
+  Args:
+      iterations (numpy.array or None): The guesses and function values of each step.
+      root (float): The actual root the run converges to.
+
+  Returns:
+      float: The estimated order of convergence, nan when the history is too short.
+
+  """
+  if iterations is None:
+    return np.nan
+  errs = np.abs(iterations[:, 0] - root)
+  # Stop at the first exact guess, the errors after it carry no information
+  exact = np.flatnonzero(errs == 0)
+  if exact.size:
+    errs = errs[:exact[0]]
+  if errs.size < 3:
+    return np.nan
+  with np.errstate(divide='ignore', invalid='ignore'):
+    sigma = np.log(errs[2:] / errs[1:-1]) / np.log(errs[1:-1] / errs[:-2])
+  sigma = sigma[np.isfinite(sigma)]
+  if sigma.size == 0:
+    return np.nan
+  return float(np.median(sigma))
+
 # Define a function named efficiency with five parameters
-def efficiency(answers_in_rad, root, algorithms, steps, tolerance):
+def efficiency(answers_in_rad, root, algorithms, steps, tolerance, iterations=None):
   """Evaluate the efficiency of different algorithms for finding roots.
 
   This function compares the answers, steps, and accuracy of different algorithms \
   for finding the roots of a function. It prints the validity, the number of correct \
-  digits, and the efficiency score for each algorithm. It also returns None.
+  digits, and the efficiency score for each algorithm. When the iteration histories \
+  are given, the empirical order of convergence of each algorithm is printed as well \
+  and used to rank algorithms that need the same number of steps. It also returns None.
 
   Args:
       answers_in_rad (list): The list of answers in radians.
@@ -488,13 +882,15 @@ def efficiency(answers_in_rad, root, algorithms, steps, tolerance):
       algorithms (list): The list of algorithm names.
       steps (list): The list of steps for each algorithm.
       tolerance (float): The tolerance for checking the validity and accuracy of the answers.
+      iterations (list, optional): The list of iteration histories for each algorithm.
 
   Returns:
       None
 
   """
-  # Create an empty list to store the digits values
+  # Create empty lists to store the digits values and the convergence orders
   digits_list = []
+  orders = []
   # Loop through each element of answers_in_rad and get their indices
   for i, answer in enumerate(answers_in_rad):
     # Get the algorithm name and the number of steps for the current answer
@@ -506,22 +902,17 @@ def efficiency(answers_in_rad, root, algorithms, steps, tolerance):
       print(f"The root by {alg} is {answer} is valid with steps {stp}.") 
       # Find the closest element in the root list to the answer
       r = min(root, key=lambda x: abs(x - answer))
-      # Count the digits that are accurate in the answer
-      digits = 0
-      # Find the minimum length of the answer and the root
-      min_len = min(len(str(answer)), len(str(r)))
-      for i in range(min_len):
-        # Compare each character in the answer with the corresponding character in the root element
-        if str(answer)[i] == str(r)[i]:
-          # Increment the digits count
-          digits += 1
-        else:
-          # Break the loop if there is a mismatch
-          break
+      # Count the digits that are accurate in the answer from the size of the error
+      err = abs(answer - r)
+      digits = 0 if err == 0 else max(0, -int(np.floor(np.log10(err))))
+      # Estimate the order of convergence from the iteration history
+      order = np.nan if iterations is None else convergence_order(iterations[i], r)
+      if not np.isnan(order):
+        print(f"The empirical order of convergence is {order:.2f}.")
       # Print the number of accurate digits
       if digits == 0:
-        # If correct digits is 0, print all digits are correct
-        print("The number of correct digits is 0 -- almost of the digits are correct.\n") # Merge the two print statements
+        # A zero error means the answer is exact
+        print("The number of correct digits is 0 -- the answer matches the root exactly.\n")
       else:
         # Otherwise, print the number of correct digits
         print(f"The number of correct digits is {digits}.\n")
@@ -530,20 +921,36 @@ def efficiency(answers_in_rad, root, algorithms, steps, tolerance):
       print(f"The root by {alg} is {answer} is invalid with steps {stp}.\n")
       # Set the digits value to a large number to indicate invalid answer
       digits = 9999
+      order = np.nan
     # Append the digits value to the digits list
     digits_list.append(digits)
+    orders.append(order)
 
   # Calculate the efficiency for each algorithm using a formula
-  efficiency_list = [steps[i] * 10 + digits_list[i] for i in range(len(algorithms))]
+  if iterations is None:
+    efficiency_list = [steps[i] * 10 + digits_list[i] for i in range(len(algorithms))]
+  else:
+    # Fewer steps first, then the higher order of convergence, invalid answers last
+    efficiency_list = [steps[i] * 10 - np.clip(np.nan_to_num(orders[i]), 0, 9)
+                       + (digits_list[i] == 9999) * 9999 for i in range(len(algorithms))]
   # Find the minimum efficiency value
   efficiency = min(efficiency_list)
   # Find the index of the minimum efficiency value in the efficiency list
   index = efficiency_list.index(efficiency)
   # Access the corresponding search from the search list
+  num_algorithms = len(algorithms)
   algorithms = algorithms[index]
-  # Display the output
-  print(f"Among the 4 searches, the efficient search is {algorithms}: "
-      f"\nbecause it has fewer steps {steps[index]}, with a greater accuracy of "
-      f"{digits_list[index]} digits. \n") 
+  # Display the output with the reason the score was based on
+  if iterations is None:
+    print(f"Among the {num_algorithms} searches, the efficient search is {algorithms}: "
+        f"\nbecause it has fewer steps {steps[index]}, with a greater accuracy of "
+        f"{digits_list[index]} digits. \n")
+  elif np.isnan(orders[index]):
+    print(f"Among the {num_algorithms} searches, the efficient search is {algorithms}: "
+        f"\nbecause it has the fewest steps {steps[index]}. \n")
+  else:
+    print(f"Among the {num_algorithms} searches, the efficient search is {algorithms}: "
+        f"\nbecause it has the fewest steps {steps[index]}, with ties broken by its higher "
+        f"order of convergence {orders[index]:.2f}. \n")
   # Return the efficiency value
   return None
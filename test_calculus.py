@@ -8,7 +8,7 @@ from io import StringIO
 from calculus import (
     simpson, trapezoid, adaptive_trapezoid,
     root_simple, root_bisection, root_secant,
-    root_tangent, root_print_header
+    root_tangent, root_print_header, root_print_step
 )
 
 class TestCalculusFunctions(unittest.TestCase):
@@ -99,6 +99,21 @@ class TestCalculusFunctions(unittest.TestCase):
         # Check if the result is close to the expected root
         self.assertAlmostEqual(result, expected_root, places=5)
 
+    def test_root_simple_no_repeated_evaluations(self):
+        """Test that root_simple does not evaluate f twice at the same guess."""
+        # Define the function and record every guess it is called with
+        calls = []
+        def f(x):
+            calls.append(x)
+            return x**2 - 4
+
+        # Call the root_simple function with a step that overshoots the root
+        result, _ = root_simple(f, 1.0, 0.3, accuracy=1e-3)
+
+        # Check the root and that every guess was evaluated only once
+        self.assertAlmostEqual(result, 2.0, places=3)
+        self.assertEqual(len(calls), len(set(calls)))
+
     def test_root_bisection_known_root(self):
         """Test the root_bisection function with a known root."""
         # Define the function
@@ -118,6 +133,21 @@ class TestCalculusFunctions(unittest.TestCase):
         # Check if the result is close to the expected root
         self.assertAlmostEqual(result, expected_root, places=5)
 
+    def test_root_bisection_tiny_values(self):
+        """Test root_bisection with function values whose products underflow to 0."""
+        # Define a function with a root at 0.3 and one without any root
+        def f(x):
+            return 1e-200 * (x - 0.3)
+
+        def g(x):
+            return 1e-200 * (x**2 + 1)
+
+        # Check that the bracket is kept and that the missing root is detected
+        result, _ = root_bisection(f, 0.0, 1.0, accuracy=1e-6)
+        self.assertAlmostEqual(result, 0.3, places=5)
+        with self.assertRaises(ValueError):
+            root_bisection(g, -1.0, 1.0)
+
     def test_root_secant_known_root(self):
         """Test the root_secant function with a known root."""
         # Define the function
@@ -188,6 +218,29 @@ class TestCalculusFunctions(unittest.TestCase):
         # Check if the result matches the expected output
         self.assertEqual(result, expected_output)
 
+    def test_root_print_step_output(self):
+        """Test if root_print_step produces the correct output."""
+        # Redirect stdout to capture the printed output
+        captured_output = StringIO()
+        sys.stdout = captured_output
+
+        # Call the root_print_step function
+        root_print_step(3, 1.5, 0.25, -1.75)
+
+        # Get the captured output
+        result = captured_output.getvalue()
+
+        # Reset redirect.
+        sys.stdout = sys.__stdout__
+
+        # Define the expected output
+        expected_output = (
+            "    3  1.5                   0.25                  -1.75               \n"
+        )
+
+        # Check if the result matches the expected output
+        self.assertEqual(result, expected_output)
+
 if __name__ == "__main__":
     unittest.main()
     
\ No newline at end of file
@@ -0,0 +1,376 @@
+"""
+ test_rootfinding.py : This module provides unit tests for the rootfinding module.
+"""
+
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+import numpy as np
+import scipy.optimize as opt
+try:
+    import numba
+except ImportError: # numba is optional, the compiled tests are skipped without it
+    numba = None
+from rootfinding import (
+    find_roots, root_bisection, root_secant, root_tangent, root_brent,
+    root_bisection_vec, root_tangent_vec, convergence_order, efficiency
+)
+
+class TestFindRoots(unittest.TestCase):
+    """
+    Test the find_roots function from the rootfinding module.
+    """
+
+    def test_find_roots_sin(self):
+        """Test find_roots with the known roots of sin(x)."""
+        # Find the roots of sin(x) in the interval
+        n, roots = find_roots(np.sin, -10, 10, 1e-6)
+
+        # Expected result (multiples of pi in the interval)
+        expected_roots = np.pi * np.arange(-3, 4)
+
+        # Check the number and the values of the roots
+        self.assertEqual(n, 7)
+        np.testing.assert_allclose(roots, expected_roots, atol=1e-5)
+
+    def test_find_roots_tan_skips_poles(self):
+        """Test that find_roots does not count the poles of tan(x) as roots."""
+        # Find the roots of tan(x) in the interval
+        n, roots = find_roots(np.tan, -10, 10, 1e-6)
+
+        # Expected result (multiples of pi, not the odd multiples of pi/2)
+        expected_roots = np.pi * np.arange(-3, 4)
+
+        # Check the number and the values of the roots
+        self.assertEqual(n, 7)
+        np.testing.assert_allclose(roots, expected_roots, atol=1e-5)
+
+    def test_find_roots_partially_defined_function(self):
+        """Test find_roots with a function that is NaN on part of the interval."""
+        # Define a function without roots that is only defined for x >= -0.2
+        def f(x):
+            with np.errstate(invalid='ignore'):
+                return np.sqrt(x + 0.2) + 1
+
+        # Call the find_roots function
+        n, roots = find_roots(f, -1, 1, 1e-5)
+
+        # The step from NaN to a positive value is not a sign change
+        self.assertEqual(n, 0)
+        self.assertEqual(roots, [])
+
+class TestRootBisection(unittest.TestCase):
+    """
+    Test the sign tests of the root_bisection functions from the rootfinding module.
+    """
+
+    @staticmethod
+    def f(x):
+        """A function with a root at 0.3 whose products of values underflow to 0."""
+        return 1e-200 * (x - 0.3)
+
+    @staticmethod
+    def g(x):
+        """A function without a root whose products of values underflow to 0."""
+        return 1e-200 * (x**2 + 1)
+
+    def test_root_bisection_tiny_values(self):
+        """Test that the sign test in the loop keeps the root bracketed."""
+        result, _, _ = root_bisection(self.f, 0.0, 1.0, accuracy=1e-6)
+        self.assertAlmostEqual(result, 0.3, places=5)
+
+    def test_root_bisection_tiny_values_no_root(self):
+        """Test that root_bisection raises for a function without a root."""
+        with self.assertRaisesRegex(Exception, r"f\(x1\) \* f\(x2\) > 0.0"):
+            root_bisection(self.g, -1.0, 1.0)
+
+    def test_root_bisection_vec_tiny_values(self):
+        """Test that root_bisection_vec keeps the brackets and detects a missing root."""
+        roots, _ = root_bisection_vec(self.f, [0.0, -1.0], [1.0, 0.5])
+        np.testing.assert_allclose(roots, [0.3, 0.3], atol=1e-5)
+        with self.assertRaisesRegex(Exception, r"f\(x1\) \* f\(x2\) > 0.0"):
+            root_bisection_vec(self.g, [-1.0], [1.0])
+
+class TestRootTangent(unittest.TestCase):
+    """
+    Test the call conventions and the damping of root_tangent from the rootfinding module.
+    """
+
+    def test_root_tangent_combined_callback(self):
+        """Test root_tangent with a callback returning (f(x), df(x)/dx)."""
+        # Define the function and its derivative separately and combined
+        def f(x):
+            return x**2 - 4
+
+        def fp(x):
+            return 2*x
+
+        def f_and_fp(x):
+            return x**2 - 4, 2*x
+
+        # Call root_tangent with both call conventions
+        result, _, step = root_tangent(f_and_fp, None, 1.5, accuracy=1e-6)
+        expected, _, expected_step = root_tangent(f, fp, 1.5, accuracy=1e-6)
+
+        # Check that both give the same root in the same number of steps
+        self.assertEqual(result, expected)
+        self.assertEqual(step, expected_step)
+        self.assertAlmostEqual(result, 2.0, places=6)
+
+    def test_root_tangent_combined_callback_single_call(self):
+        """Test that root_tangent calls the combined callback once per guess."""
+        # Define the combined callback and record every guess it is called with
+        calls = []
+        def f_and_fp(x):
+            calls.append(x)
+            return x**2 - 4, 2*x
+
+        # Call root_tangent with the combined callback
+        _, _, step = root_tangent(f_and_fp, None, 1.5, accuracy=1e-6)
+
+        # One call at the initial guess and one per step, including the last one
+        self.assertEqual(len(calls), step + 2)
+
+    def test_root_tangent_damped_arctan(self):
+        """Test that the damped root_tangent converges for arctan(x) from x0 = 1.5."""
+        def f_and_fp(x):
+            return np.arctan(x), 1 / (1 + x**2)
+
+        # Call the damped root_tangent
+        result, _, step = root_tangent(f_and_fp, None, 1.5, damped=True)
+
+        # Check the root and the number of steps
+        self.assertAlmostEqual(result, 0.0, places=6)
+        self.assertEqual(step, 5)
+
+    def test_root_tangent_undamped_arctan_diverges(self):
+        """Test that the plain root_tangent diverges for arctan(x) from x0 = 1.5."""
+        def f_and_fp(x):
+            return np.arctan(x), 1 / (1 + x**2)
+
+        # The steps grow until the derivative underflows to zero
+        with np.errstate(over='ignore'):
+            with self.assertRaisesRegex(Exception, "df/dx = 0 algorithm fails"):
+                root_tangent(f_and_fp, None, 1.5)
+
+class TestRootBrent(unittest.TestCase):
+    """
+    Test the root_brent function from the rootfinding module.
+    """
+
+    def test_root_brent_known_root(self):
+        """Test root_brent with a known root and its number of steps."""
+        # Define the function
+        def f(x):
+            return x**2 - 4
+
+        # Call the root_brent function on an interval containing the root
+        result, iterations, step = root_brent(f, 0, 3, accuracy=1e-6)
+
+        # Check the root and that it needs far fewer steps than bisection (22)
+        self.assertAlmostEqual(result, 2.0, places=5)
+        self.assertEqual(step, 7)
+        self.assertIsNone(iterations)
+
+    def test_root_brent_matches_scipy(self):
+        """Test root_brent against scipy.optimize.brentq."""
+        # Define the function
+        def f(x):
+            return x**3 - 2*x - 5
+
+        # Call the root_brent function with a tight accuracy
+        result, _, _ = root_brent(f, 2, 3, accuracy=1e-12)
+
+        # Check the result against scipy
+        self.assertAlmostEqual(result, opt.brentq(f, 2, 3, xtol=1e-12), places=11)
+
+    def test_root_brent_endpoint_root(self):
+        """Test root_brent when the root is at one end of the interval."""
+        # Define the function
+        def f(x):
+            return x**2 - 4
+
+        # Call the root_brent function with f(x1) = 0
+        result, _, step = root_brent(f, 2.0, 3.0)
+
+        # Check that the endpoint is returned without any steps
+        self.assertEqual(result, 2.0)
+        self.assertEqual(step, 0)
+
+    def test_root_brent_debug_iterations(self):
+        """Test that root_brent records one row per step in debug mode."""
+        # Define the function
+        def f(x):
+            return x**2 - 4
+
+        # Call the root_brent function in debug mode without printing
+        with redirect_stdout(StringIO()):
+            result, iterations, step = root_brent(f, 0, 3, root_debug=True)
+
+        # Check the shape of the history and that it contains the returned guess
+        self.assertEqual(iterations.shape, (step + 1, 2))
+        self.assertIn(result, iterations[:, 0])
+
+    def test_root_brent_bad_bracket(self):
+        """Test that root_brent raises when f(x1) and f(x2) have the same sign."""
+        with self.assertRaisesRegex(Exception, r"f\(x1\) \* f\(x2\) > 0.0"):
+            root_brent(lambda x: x**2 - 4, 3, 4)
+
+    def test_root_brent_scaled_function(self):
+        """Test that root_brent keeps the bracket for a function with tiny values."""
+        # The products of these function values underflow to 0
+        for scale in (1e-160, 1e-170):
+            result, _, _ = root_brent(lambda x, s=scale: s*(np.exp(x) - 1.5), 0.0, 1.0, 1e-10)
+
+            # Check the result against the exact root log(1.5)
+            self.assertAlmostEqual(result, np.log(1.5), places=9)
+
+    def test_root_brent_max_steps(self):
+        """Test that root_brent raises when the maximum number of steps is exceeded."""
+        with self.assertRaisesRegex(Exception, "maximum number of steps 3 exceeded"):
+            root_brent(lambda x: x**2 - 4, 0, 3, max_steps=3)
+
+class TestConvergenceOrder(unittest.TestCase):
+    """
+    Test the convergence_order and efficiency functions from the rootfinding module.
+    """
+
+    @staticmethod
+    def f(x):
+        """The cubic test function with a single real root."""
+        return x**3 - 2*x - 5
+
+    def setUp(self):
+        """Compute the histories of the tangent and the secant searches."""
+        self.root = opt.brentq(self.f, 2, 3, xtol=1e-15)
+        with redirect_stdout(StringIO()):
+            _, self.tangent, _ = root_tangent(self.f, lambda x: 3*x**2 - 2, 3.0,
+                                              accuracy=1e-12, root_debug=True)
+            _, self.secant, _ = root_secant(self.f, 2.0, 3.0, accuracy=1e-12, root_debug=True)
+
+    def test_convergence_order_tangent(self):
+        """Test that the tangent search converges quadratically."""
+        self.assertAlmostEqual(convergence_order(self.tangent, self.root), 2.0, delta=0.1)
+
+    def test_convergence_order_secant(self):
+        """Test that the secant search converges with an order of about 1.5."""
+        self.assertAlmostEqual(convergence_order(self.secant, self.root), 1.5, delta=0.15)
+
+    def test_convergence_order_no_history(self):
+        """Test that convergence_order returns nan without a history."""
+        self.assertTrue(np.isnan(convergence_order(None, self.root)))
+
+    def test_convergence_order_short_history(self):
+        """Test that convergence_order returns nan for fewer than three guesses."""
+        self.assertTrue(np.isnan(convergence_order(self.tangent[:2], self.root)))
+
+    def test_efficiency_breaks_ties_by_order(self):
+        """Test that efficiency prefers the higher order when the steps are the same."""
+        # Call efficiency with two valid answers found in the same number of steps
+        output = StringIO()
+        with redirect_stdout(output):
+            efficiency([self.secant[-1, 0], self.tangent[-1, 0]], [self.root],
+                       ['Secant Search', 'Tangent Search'], [5, 5], 1e-6,
+                       [self.secant, self.tangent])
+
+        # Check the winner and that the order is given as the reason
+        summary = output.getvalue().split("Among the 2 searches")[1]
+        self.assertIn("the efficient search is Tangent Search", summary)
+        self.assertIn("ties broken by its higher order of convergence", summary)
+
+class TestVectorizedRoots(unittest.TestCase):
+    """
+    Test the array versions of the root finding functions from the rootfinding module.
+    """
+
+    def test_root_bisection_vec_matches_scalar(self):
+        """Test that every lane of root_bisection_vec matches root_bisection."""
+        # Define the function and the intervals
+        def f(x):
+            return x**2 - 4
+        x1 = np.linspace(0, 1.5, 5)
+        x2 = np.full(5, 3.0)
+
+        # Call the array and the scalar functions
+        roots, steps = root_bisection_vec(f, x1, x2, accuracy=1e-6)
+        expected = [root_bisection(f, a, b, accuracy=1e-6) for a, b in zip(x1, x2)]
+
+        # Check the roots and the steps of each lane
+        np.testing.assert_array_equal(roots, [r for r, _, _ in expected])
+        np.testing.assert_array_equal(steps, [s for _, _, s in expected])
+
+    def test_root_tangent_vec_matches_scalar(self):
+        """Test that every lane of root_tangent_vec matches root_tangent."""
+        # Define the function, its derivative and the initial guesses
+        def f(x):
+            return x**2 - 4
+
+        def fp(x):
+            return 2*x
+        x0 = np.array([1.5, 2.5, 3.0, 2.0])
+
+        # Call the array and the scalar functions
+        roots, steps = root_tangent_vec(f, fp, x0, accuracy=1e-6)
+        expected = [root_tangent(f, fp, x, accuracy=1e-6) for x in x0]
+
+        # Check the roots and the steps of each lane
+        np.testing.assert_allclose(roots, [r for r, _, _ in expected], rtol=1e-12)
+        np.testing.assert_array_equal(steps, [s for _, _, s in expected])
+
+    def test_root_bisection_vec_bad_bracket(self):
+        """Test that root_bisection_vec raises when any lane has no sign change."""
+        with self.assertRaisesRegex(Exception, r"f\(x1\) \* f\(x2\) > 0.0"):
+            root_bisection_vec(lambda x: x**2 - 4, [0.0, 3.0], [3.0, 4.0])
+
+    def test_root_tangent_vec_zero_derivative(self):
+        """Test that root_tangent_vec raises like root_tangent when fp(x0) = 0."""
+        # The initial guess is a root with a zero derivative
+        with self.assertRaisesRegex(Exception, "df/dx = 0 algorithm fails"):
+            root_tangent(lambda x: x**2, lambda x: 2*x, 0.0)
+        with self.assertRaisesRegex(Exception, "df/dx = 0 algorithm fails"):
+            root_tangent_vec(lambda x: x**2, lambda x: 2*x, [0.0, 1.0])
+
+    def test_root_tangent_vec_max_steps(self):
+        """Test that root_tangent_vec raises when the maximum number of steps is exceeded."""
+        with self.assertRaisesRegex(Exception, "maximum number of steps 2 exceeded"):
+            root_tangent_vec(lambda x: x**2 - 4, lambda x: 2*x, [1.5, 10.0], max_steps=2)
+
+@unittest.skipIf(numba is None, "numba is not installed")
+class TestCompiledBatch(unittest.TestCase):
+    """
+    Test the parallel numba path of root_bisection_vec from the rootfinding module.
+    """
+
+    def test_batch_matches_numpy_path(self):
+        """Test that the numba.prange batch matches the NumPy mask path lane by lane."""
+        # Define the same function as a numba.njit function and as a numpy function
+        f_jit = numba.njit(lambda x: x**3 - 2*x - 5)
+
+        def f(x):
+            return x**3 - 2*x - 5
+        x1 = np.linspace(1.0, 2.0, 50).reshape(5, 10)
+        x2 = np.full((5, 10), 3.0)
+
+        # Call root_bisection_vec on both paths
+        roots_jit, steps_jit = root_bisection_vec(f_jit, x1, x2, accuracy=1e-10)
+        roots, steps = root_bisection_vec(f, x1, x2, accuracy=1e-10)
+
+        # Check that the shapes, the roots and the steps agree
+        self.assertEqual(roots_jit.shape, x1.shape)
+        np.testing.assert_array_equal(roots_jit, roots)
+        np.testing.assert_array_equal(steps_jit, steps)
+
+    def test_batch_tiny_values_no_root(self):
+        """Test that the numba batch detects a missing root for tiny function values."""
+        g_jit = numba.njit(lambda x: 1e-200 * (x**2 + 1))
+        with self.assertRaisesRegex(Exception, r"f\(x1\) \* f\(x2\) > 0.0"):
+            root_bisection_vec(g_jit, np.array([-1.0]), np.array([1.0]))
+
+    def test_batch_bad_bracket(self):
+        """Test that the numba.prange batch raises when any lane has no sign change."""
+        f_jit = numba.njit(lambda x: x**2 - 4)
+        with self.assertRaisesRegex(Exception, r"f\(x1\) \* f\(x2\) > 0.0"):
+            root_bisection_vec(f_jit, np.array([0.0, 3.0]), np.array([3.0, 4.0]))
+
+if __name__ == "__main__":
+    unittest.main()